@@ -5,21 +5,23 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
+from time import perf_counter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import cv2
+import numpy as np
 from rich.console import Console
 
 from src.audio.player import AudioPlayer
 from src.config import load_config, setup_logging
+from src.core.recording import make_writer, process_video_threaded
 from src.core.renderer import SpellRenderer
 from src.effects.glow import apply_glow
 from src.effects.screen import ScreenEffects
-from src.gestures.recognizer import GestureRecognizer
+from src.gestures.recognizer import GESTURE_NAMES, GestureRecognizer
 from src.gestures.tracker import GestureEvent, GestureTracker
 from src.particles.engine import ParticleEngine
 from src.spells.fireball import Fireball
@@ -29,8 +31,8 @@ from src.spells.registry import SpellRegistry
 from src.spells.shield import Shield
 from src.spells.teleport import Teleport
 from src.spells.wind import Wind
-from src.vision.camera import Camera
-from src.vision.hands import HandTracker
+from src.vision.camera import Camera, Frame
+from src.vision.hands import HandTracker, preload_mediapipe
 
 console = Console()
 
@@ -40,7 +42,20 @@ def main() -> None:
     parser.add_argument("--source", "-s", default=None, help="Video file (default: webcam)")
     parser.add_argument("--output", "-o", default=None, help="Output path")
     parser.add_argument("--config", "-c", default=None, help="Config YAML path")
+    parser.add_argument(
+        "--no-preview",
+        action="store_true",
+        help="Skip the live preview window (Ctrl+C stops)",
+    )
+    parser.add_argument(
+        "--preview-every",
+        type=int,
+        default=3,
+        help="Show every Nth frame in the preview",
+    )
     args = parser.parse_args()
+    # Warm the MediaPipe import while config, banner and camera set-up run
+    preload_mediapipe()
 
     settings = load_config(args.config)
     setup_logging(settings.logging)
@@ -82,64 +97,76 @@ def main() -> None:
     w = settings.camera.width
     h = settings.camera.height
     fps = settings.camera.fps
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    writer = cv2.VideoWriter(output, fourcc, fps, (w, h))
+    writer = make_writer(output, w, h, fps)
 
     console.print(f"[green]Recording to {output}[/green]")
+    show_preview = not args.no_preview
+    preview_every = max(1, args.preview_every)
     frame_count = 0
-    last_time = time.time()
+    last_time = perf_counter()
+
+    # Bind hot lookups once; the callback below runs for every frame
+    glow_enabled = settings.particles.glow_enabled
+    glow_intensity = settings.particles.glow_intensity
+    track_hands = hand_tracker.process
+    classify = recognizer.classify
+    update_gesture = tracker.update
+    imshow = cv2.imshow
+    wait_key = cv2.waitKey
+    quit_keys = (ord("q"), 27)
+
+    def process(frame_data: Frame) -> np.ndarray | None:
+        nonlocal frame_count, last_time
+
+        frame = frame_data.image
+        frame_count += 1
+        now = perf_counter()
+        dt = now - last_time
+        if dt > 0.1:
+            dt = 0.1
+        last_time = now
+
+        # Process
+        hands = track_hands(frame)
+        hand_x = hand_y = None
+        gesture_name = ""
+        if hands:
+            result = classify(hands[0])
+            state = update_gesture(result)
+            hand_x, hand_y = hands[0].center.x, hands[0].center.y
+            gesture_name = GESTURE_NAMES[result.gesture]
+        else:
+            state = update_gesture(None)
+
+        if state and state.event != GestureEvent.NONE:
+            registry.handle_event(
+                state.event, hand_x or 0.5, hand_y or 0.5, gesture_name,
+            )
+
+        registry.update(dt, hand_x, hand_y)
+        particles.update(dt)
+        screen_fx.update(dt)
+
+        frame = particles.render(frame)
+        frame = registry.render(frame)
+        if glow_enabled and particles.count > 0:
+            frame = apply_glow(frame, intensity=glow_intensity)
+        frame = screen_fx.apply(frame)
+        renderer.draw_landmarks(frame, hands)
+        renderer.draw_mana_bar(frame, registry.mana)
+
+        if show_preview and frame_count % preview_every == 0:
+            imshow("Recording - AR Spellcaster", frame)
+            if wait_key(1) & 0xFF in quit_keys:
+                return None
+
+        if frame_count % 30 == 0:
+            console.print(f"[dim]Frame {frame_count}...[/dim]", end="\r")
+
+        return frame
 
     try:
-        while True:
-            frame_data = camera.read()
-            if frame_data is None:
-                break
-
-            frame = frame_data.image
-            frame_count += 1
-            now = time.time()
-            dt = min(now - last_time, 0.1)
-            last_time = now
-
-            # Process
-            hands = hand_tracker.process(frame)
-            hand_x = hand_y = None
-            gesture_name = ""
-            if hands:
-                result = recognizer.classify(hands[0])
-                state = tracker.update(result)
-                hand_x, hand_y = hands[0].center.x, hands[0].center.y
-                gesture_name = result.gesture.name.lower()
-            else:
-                state = tracker.update(None)
-
-            if state and state.event != GestureEvent.NONE:
-                registry.handle_event(
-                    state.event, hand_x or 0.5, hand_y or 0.5, gesture_name,
-                )
-
-            registry.update(dt, hand_x, hand_y)
-            particles.update(dt)
-            screen_fx.update(dt)
-
-            frame = particles.render(frame)
-            frame = registry.render(frame)
-            if settings.particles.glow_enabled and particles.count > 0:
-                frame = apply_glow(frame, intensity=settings.particles.glow_intensity)
-            frame = screen_fx.apply(frame)
-            renderer.draw_landmarks(frame, hands)
-            renderer.draw_mana_bar(frame, registry.mana)
-
-            writer.write(frame)
-
-            cv2.imshow("Recording - AR Spellcaster", frame)
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord("q") or key == 27:
-                break
-
-            if frame_count % 30 == 0:
-                console.print(f"[dim]Frame {frame_count}...[/dim]", end="\r")
-
+        process_video_threaded(camera, process, writer)
     except KeyboardInterrupt:
         console.print("\n[yellow]Recording stopped.[/yellow]")
     finally:
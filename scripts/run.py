@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from dataclasses import replace
 
 # Ensure project root is on Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,6 +16,7 @@ from rich.table import Table
 
 from src.config import load_config, setup_logging
 from src.core.engine import SpellEngine
+from src.vision.hands import preload_mediapipe
 
 console = Console()
 
@@ -58,15 +60,17 @@ Controls:
         help="Enable verbose logging",
     )
     args = parser.parse_args()
+    # Warm the MediaPipe import while config, banner and camera set-up run
+    preload_mediapipe()
 
     # Load configuration
     settings = load_config(args.config)
     if args.verbose:
-        settings.logging.level = "DEBUG"
+        settings = replace(settings, logging=replace(settings.logging, level="DEBUG"))
     setup_logging(settings.logging)
 
     if args.no_audio:
-        settings.audio.enabled = False
+        settings = replace(settings, audio=replace(settings.audio, enabled=False))
 
     # Display banner
     console.print()
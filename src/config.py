@@ -2,20 +2,86 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Self, get_type_hints
 
 import yaml
-from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 DEFAULT_CONFIG_PATH = PROJECT_ROOT / "configs" / "default.yaml"
 
-
-class CameraConfig(BaseModel):
+# Background thread that performs log I/O on behalf of the frame loop
+_log_listener: logging.handlers.QueueListener | None = None
+
+# libyaml-backed loader is several times faster; not every PyYAML build ships it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _ConfigSection:
+    """Base for config dataclasses that can be built from parsed YAML."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any] | None) -> Self:
+        """Build an instance from a raw mapping, coercing scalar types.
+
+        Unknown keys are ignored; missing keys keep their defaults.
+
+        Raises:
+            TypeError: If ``raw`` is not a mapping or a value cannot be
+                coerced to the field's type.
+        """
+        if raw is not None and not isinstance(raw, dict):
+            raise TypeError(f"{cls.__name__}: expected a mapping, got {type(raw).__name__}")
+        hints = _field_types(cls)
+        kwargs = {
+            name: _coerce(hints[name], value, f"{cls.__name__}.{name}")
+            for name, value in (raw or {}).items()
+            if name in hints
+        }
+        return cls(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def _field_types(cls: type) -> dict[str, type]:
+    """Resolve (string) field annotations of a config dataclass once per class."""
+    return get_type_hints(cls)
+
+
+def _coerce(tp: type, value: Any, name: str) -> Any:
+    """Coerce a parsed YAML value to ``tp``; ints widen to float, integral floats narrow to int."""
+    if isinstance(tp, type) and issubclass(tp, _ConfigSection):
+        if isinstance(value, tp):
+            return value
+        if value is None or isinstance(value, dict):
+            return tp.from_dict(value)
+    elif tp is bool:
+        if isinstance(value, bool):
+            return value
+    elif tp is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+    elif tp is float:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    elif isinstance(value, tp):
+        return value
+    raise TypeError(f"{name}: expected {tp.__name__}, got {type(value).__name__}")
+
+
+@dataclass(frozen=True, slots=True)
+class CameraConfig(_ConfigSection):
     """Camera capture configuration."""
 
     device_id: int = 0
@@ -24,15 +90,19 @@ class CameraConfig(BaseModel):
     fps: int = 30
 
 
-class HandsConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class HandsConfig(_ConfigSection):
     """MediaPipe hand tracking configuration."""
 
     max_hands: int = 2
     min_detection_confidence: float = 0.7
     min_tracking_confidence: float = 0.5
+    process_every_n_frames: int = 1
+    async_tracking: bool = False
 
 
-class GesturesConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GesturesConfig(_ConfigSection):
     """Gesture recognition configuration."""
 
     swipe_threshold: float = 0.08
@@ -41,7 +111,8 @@ class GesturesConfig(BaseModel):
     debounce_frames: int = 3
 
 
-class ParticlesConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ParticlesConfig(_ConfigSection):
     """Particle system configuration."""
 
     max_particles: int = 2000
@@ -49,7 +120,8 @@ class ParticlesConfig(BaseModel):
     glow_intensity: float = 0.3
 
 
-class SpellsConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SpellsConfig(_ConfigSection):
     """Spell system configuration."""
 
     max_mana: int = 100
@@ -58,21 +130,24 @@ class SpellsConfig(BaseModel):
     show_spell_name: bool = True
 
 
-class AudioConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AudioConfig(_ConfigSection):
     """Audio configuration."""
 
     enabled: bool = True
     volume: float = 0.5
 
 
-class RecordingConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RecordingConfig(_ConfigSection):
     """Recording and screenshot configuration."""
 
     output_dir: str = "data/recordings"
     screenshot_key: str = "thumbs_up"
 
 
-class LoggingConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LoggingConfig(_ConfigSection):
     """Logging configuration."""
 
     level: str = "INFO"
@@ -80,55 +155,131 @@ class LoggingConfig(BaseModel):
     file: str = "logs/gesture-hud.log"
 
 
-class Settings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Settings(_ConfigSection):
     """Root configuration for AR Spellcaster."""
 
-    camera: CameraConfig = Field(default_factory=CameraConfig)
-    hands: HandsConfig = Field(default_factory=HandsConfig)
-    gestures: GesturesConfig = Field(default_factory=GesturesConfig)
-    particles: ParticlesConfig = Field(default_factory=ParticlesConfig)
-    spells: SpellsConfig = Field(default_factory=SpellsConfig)
-    audio: AudioConfig = Field(default_factory=AudioConfig)
-    recording: RecordingConfig = Field(default_factory=RecordingConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    camera: CameraConfig = field(default_factory=CameraConfig)
+    hands: HandsConfig = field(default_factory=HandsConfig)
+    gestures: GesturesConfig = field(default_factory=GesturesConfig)
+    particles: ParticlesConfig = field(default_factory=ParticlesConfig)
+    spells: SpellsConfig = field(default_factory=SpellsConfig)
+    audio: AudioConfig = field(default_factory=AudioConfig)
+    recording: RecordingConfig = field(default_factory=RecordingConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
 
 
 def load_config(path: str | Path | None = None) -> Settings:
     """Load configuration from YAML file.
 
+    Parsed settings are cached per resolved path, modification time and
+    size, so repeated loads of an unchanged file skip YAML parsing and
+    validation. Settings are immutable, so the cached instance is shared.
+    Call ``load_config.cache_clear()`` to force a re-read.
+
     Args:
         path: Path to YAML config file. Uses default if not provided.
 
     Returns:
-        Validated Settings instance.
+        Validated, immutable Settings instance.
     """
     config_path = Path(path) if path else DEFAULT_CONFIG_PATH
 
-    raw: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            raw = yaml.safe_load(f) or {}
-        logger.info("Loaded config from %s", config_path)
-    else:
+    if not config_path.exists():
         logger.warning("Config file not found at %s, using defaults", config_path)
+        return _DEFAULT_SETTINGS
+
+    stat = config_path.stat()
+    if stat.st_size < 4:
+        # Too short to hold a "key: value" pair; skip YAML parsing entirely
+        return _DEFAULT_SETTINGS
+    return _load_cached(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
 
-    return Settings(**raw)
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Settings:
+    """Parse and validate a config file; keyed on mtime and size so edits invalidate it."""
+    with open(path) as f:
+        raw: dict[str, Any] = yaml.load(f, Loader=_YAML_LOADER) or {}
+    logger.info("Loaded config from %s", path)
+    return Settings.from_dict(raw)
+
+
+# Settings are immutable, so every fallback to defaults can share one instance
+_DEFAULT_SETTINGS = Settings()
+
+load_config.cache_clear = _load_cached.cache_clear  # type: ignore[attr-defined]
 
 
 def setup_logging(config: LoggingConfig) -> None:
-    """Configure application-wide logging."""
+    """Configure application-wide logging.
+
+    Records are queued by the calling thread and written to the console and
+    log file by a background listener, keeping disk I/O off the frame loop.
+    The log file is opened on first write and written in batches; records at
+    ERROR or above flush the batch immediately.
+    """
+    global _log_listener
+
     log_file = PROJECT_ROOT / config.file
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    logging.basicConfig(
-        level=getattr(logging, config.level.upper(), logging.INFO),
-        format=config.format,
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(log_file),
-        ],
+    formatter = logging.Formatter(config.format)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setFormatter(formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+
+    root = logging.getLogger()
+    if _log_listener is not None:
+        # Reconfiguring: retire the previous listener and its queue handler
+        _stop_log_listener()
+    else:
+        atexit.register(_stop_log_listener)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(getattr(logging, config.level.upper(), logging.INFO))
+
+    _log_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        buffered_file_handler,
     )
+    _log_listener.start()
 
     # Suppress noisy library logs
     for noisy in ("mediapipe", "PIL", "sounddevice"):
         logging.getLogger(noisy).setLevel(logging.WARNING)
+
+
+def _stop_log_listener() -> None:
+    """Drain queued records, stop the background listener and flush buffered output.
+
+    Safe to call more than once.
+    """
+    global _log_listener
+
+    if _log_listener is None:
+        return
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    _log_listener.stop()
+    _close_handlers(_log_listener.handlers)
+    _log_listener = None
+
+
+def _close_handlers(handlers: tuple[logging.Handler, ...]) -> None:
+    """Close listener handlers, flushing memory buffers into their targets first."""
+    for handler in handlers:
+        target = handler.target if isinstance(handler, logging.handlers.MemoryHandler) else None
+        handler.close()
+        if target is not None:
+            target.close()
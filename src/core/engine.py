@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import cv2
+import numpy as np
 
 from src.audio.player import AudioPlayer
 from src.config import Settings
 from src.core.renderer import SpellRenderer
 from src.effects.glow import apply_glow
 from src.effects.screen import ScreenEffects
-from src.gestures.recognizer import GestureRecognizer
+from src.gestures.recognizer import GESTURE_NAMES, GestureRecognizer
 from src.gestures.tracker import GestureEvent, GestureTracker
 from src.particles.engine import ParticleEngine
 from src.spells.fireball import Fireball
@@ -23,7 +25,7 @@ from src.spells.shield import Shield
 from src.spells.teleport import Teleport
 from src.spells.wind import Wind
 from src.vision.camera import Camera
-from src.vision.hands import HandTracker
+from src.vision.hands import HandData, HandTracker
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +38,23 @@ class SpellEngine:
     → spell registry → particles + screen effects → display.
     """
 
+    # waitKey codes that end the loop: 'q' and ESC
+    _QUIT_KEYS = frozenset({ord("q"), 27})
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
 
         # Vision
         self.camera = Camera(settings.camera)
         self.hand_tracker = HandTracker(settings.hands)
+        self._tracking_pool: ThreadPoolExecutor | None = None
+        if settings.hands.async_tracking:
+            self._tracking_pool = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="hand-tracker",
+            )
+        self._tracking_future: Future[list[HandData]] | None = None
+        self._last_hands: list[HandData] = []
 
         # Gestures
         self.gesture_recognizer = GestureRecognizer()
@@ -116,15 +129,19 @@ class SpellEngine:
             return
 
         self._running = True
-        self._last_time = time.time()
+        self._last_time = time.perf_counter()
         logger.info("Spell engine started")
 
+        # Bind per-frame lookups once
+        process_frame = self._process_frame
+        wait_key = cv2.waitKey
+        quit_keys = self._QUIT_KEYS
+
         try:
             while self._running:
-                self._process_frame()
+                process_frame()
 
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord("q") or key == 27:
+                if wait_key(1) & 0xFF in quit_keys:
                     break
         finally:
             self._cleanup()
@@ -139,13 +156,13 @@ class SpellEngine:
         frame = frame_data.image
         self._frame_count += 1
 
-        # Delta time
-        now = time.time()
+        # Delta time (monotonic, immune to wall-clock adjustments)
+        now = time.perf_counter()
         dt = min(now - self._last_time, 0.1)  # Cap at 100ms
         self._last_time = now
 
         # 1. Hand tracking
-        hands = self.hand_tracker.process(frame)
+        hands = self._track_hands(frame)
 
         # 2. Gesture recognition
         gesture_result = None
@@ -158,7 +175,7 @@ class SpellEngine:
             gesture_state = self.gesture_tracker.update(gesture_result)
             hand_x = hands[0].center.x
             hand_y = hands[0].center.y
-            self._last_gesture_name = gesture_result.gesture.name.lower()
+            self._last_gesture_name = GESTURE_NAMES[gesture_result.gesture]
         else:
             gesture_state = self.gesture_tracker.update(None)
 
@@ -204,6 +221,28 @@ class SpellEngine:
         # 12. Display
         cv2.imshow("AR Spellcaster", frame)
 
+    def _track_hands(self, frame: np.ndarray) -> list[HandData]:
+        """Track hands inline, or on the worker thread when async tracking is on.
+
+        In async mode the most recently completed result is returned and a
+        new frame is submitted once the worker is idle, so inference overlaps
+        with rendering at the cost of up to one frame of latency.
+        """
+        if self._tracking_pool is None:
+            return self.hand_tracker.process(frame)
+
+        future = self._tracking_future
+        if future is not None and future.done():
+            self._last_hands = future.result()
+            future = None
+
+        if future is None:
+            # The frame is drawn on after this call, so the worker gets its own copy
+            future = self._tracking_pool.submit(self.hand_tracker.process, frame.copy())
+        self._tracking_future = future
+
+        return self._last_hands
+
     def _handle_gesture_event(
         self,
         event: GestureEvent,
@@ -236,6 +275,8 @@ class SpellEngine:
         """Release all resources."""
         self._running = False
         self.camera.release()
+        if self._tracking_pool is not None:
+            self._tracking_pool.shutdown(wait=True)
         self.hand_tracker.release()
         self.audio.stop()
         cv2.destroyAllWindows()
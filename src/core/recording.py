@@ -0,0 +1,199 @@
+"""Threaded video recording pipeline and encoder backends."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from typing import Protocol
+
+import cv2
+import numpy as np
+
+from src.vision.camera import Camera, Frame
+
+logger = logging.getLogger(__name__)
+
+
+class FrameWriter(Protocol):
+    """Minimal video writer interface shared by the OpenCV, ffmpegcv and PyAV backends."""
+
+    def write(self, frame: np.ndarray) -> None: ...
+
+    def release(self) -> None: ...
+
+
+class PyAVWriter:
+    """Multi-threaded libx264 encoder backed by PyAV.
+
+    Args:
+        path: Output video path.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Output frame rate.
+    """
+
+    def __init__(self, path: str, width: int, height: int, fps: int) -> None:
+        import av
+
+        self._av = av
+        self._container = av.open(path, mode="w")
+        try:
+            self._stream = self._container.add_stream("libx264", rate=fps)
+            self._stream.width = width
+            self._stream.height = height
+            self._stream.pix_fmt = "yuv420p"
+            self._stream.thread_type = "AUTO"
+        except Exception:
+            # e.g. an FFmpeg build without libx264; don't leak the opened file
+            self._container.close()
+            raise
+
+    def write(self, frame: np.ndarray) -> None:
+        """Encode a single BGR frame."""
+        video_frame = self._av.VideoFrame.from_ndarray(frame, format="bgr24")
+        for packet in self._stream.encode(video_frame):
+            self._container.mux(packet)
+
+    def release(self) -> None:
+        """Flush the encoder and close the container."""
+        for packet in self._stream.encode():
+            self._container.mux(packet)
+        self._container.close()
+
+
+def make_writer(path: str, width: int, height: int, fps: int) -> FrameWriter:
+    """Create the fastest available video writer.
+
+    Prefers NVENC via ffmpegcv, then multi-threaded libx264 via PyAV, and
+    falls back to OpenCV's single-threaded mp4v encoder.
+
+    ffmpegcv only launches ffmpeg on the first ``write``, so a missing NVENC
+    encoder is not detected here; it surfaces as an error re-raised by
+    ``process_video_threaded`` instead of hanging the writer thread.
+    """
+    try:
+        import ffmpegcv
+
+        return ffmpegcv.VideoWriterNV(path, "h264", fps)
+    except ImportError:
+        pass
+    except Exception as exc:
+        logger.info("NVENC unavailable (%s), trying libx264", exc)
+
+    try:
+        return PyAVWriter(path, width, height, fps)
+    except ImportError:
+        pass
+    except Exception as exc:
+        logger.info("libx264 unavailable (%s), falling back to mp4v", exc)
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    return cv2.VideoWriter(path, fourcc, fps, (width, height))
+
+
+def process_video_threaded(
+    camera: Camera,
+    callback: Callable[[Frame], np.ndarray | None],
+    writer: FrameWriter,
+    prefetch: int = 8,
+) -> int:
+    """Run ``callback`` over camera frames with capture and encoding on worker threads.
+
+    A reader thread fills a bounded prefetch queue from ``camera.read`` and a
+    writer thread drains processed frames into ``writer``, so decode and
+    encode latency overlap with per-frame compute on the calling thread.
+
+    Args:
+        camera: Opened camera to read frames from.
+        callback: Processes one frame; returns the frame to write, or None to stop.
+        writer: Video writer receiving processed frames.
+        prefetch: Maximum number of frames buffered in each queue.
+
+    Returns:
+        Number of frames handed to the writer.
+
+    Raises:
+        TypeError: If ``callback`` returns a frame that is not uint8.
+        Exception: The first error raised by ``camera.read`` or ``writer.write``
+            on a worker thread, re-raised once both threads have stopped.
+    """
+    read_queue: queue.Queue[Frame | None] = queue.Queue(maxsize=prefetch)
+    write_queue: queue.Queue[np.ndarray | None] = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    errors: list[Exception] = []
+
+    def _offer(frame_data: Frame | None) -> None:
+        # Time out periodically so a stopped consumer cannot strand us on put()
+        while not stop.is_set():
+            try:
+                read_queue.put(frame_data, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _read_loop() -> None:
+        try:
+            while not stop.is_set():
+                frame_data = camera.read()
+                if frame_data is None:
+                    break
+                _offer(frame_data)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            # Always wake the consumer, including after a capture error
+            _offer(None)
+
+    def _write_loop() -> None:
+        try:
+            while True:
+                frame = write_queue.get()
+                if frame is None:
+                    return
+                writer.write(frame)
+        except Exception as exc:
+            errors.append(exc)
+
+    def _hand_off(frame: np.ndarray | None) -> bool:
+        # A dead writer never drains the queue, so never block on it indefinitely
+        while encoder.is_alive():
+            try:
+                write_queue.put(frame, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    reader = threading.Thread(target=_read_loop, name="record-reader", daemon=True)
+    encoder = threading.Thread(target=_write_loop, name="record-writer", daemon=True)
+    reader.start()
+    encoder.start()
+
+    written = 0
+    try:
+        while True:
+            frame_data = read_queue.get()
+            if frame_data is None:
+                break
+            frame = callback(frame_data)
+            if frame is None:
+                break
+            if frame.dtype != np.uint8:
+                raise TypeError(f"Recorded frames must be uint8, got {frame.dtype}")
+            # Effects may hand back views; encoders copy non-contiguous input internally
+            if not frame.flags.c_contiguous:
+                frame = np.ascontiguousarray(frame)
+            if not _hand_off(frame):
+                break
+            written += 1
+    finally:
+        stop.set()
+        _hand_off(None)
+        encoder.join()
+        reader.join(timeout=1.0)
+
+    if errors:
+        raise errors[0]
+    return written
@@ -3,15 +3,79 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from typing import NamedTuple
 
 import cv2
 import numpy as np
 
 from src.config import Settings
 from src.spells.registry import ManaSystem
+from src.vision.hands import HandData
 
 logger = logging.getLogger(__name__)
 
+# Landmark index pairs forming the hand skeleton, shaped (edges, 2) for fancy indexing
+HAND_CONNECTIONS = np.array(
+    [
+        (0, 1), (1, 2), (2, 3), (3, 4),
+        (0, 5), (5, 6), (6, 7), (7, 8),
+        (0, 9), (9, 10), (10, 11), (11, 12),
+        (0, 13), (13, 14), (14, 15), (15, 16),
+        (0, 17), (17, 18), (18, 19), (19, 20),
+        (5, 9), (9, 13), (13, 17),
+    ],
+    dtype=np.intp,
+)
+# Landmarks needed for every skeleton edge to have both endpoints
+_MIN_LANDMARKS = int(HAND_CONNECTIONS.max()) + 1
+
+
+class _BarLayout(NamedTuple):
+    """Pixel geometry of the mana bar for one frame size."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    outer_tl: tuple[int, int]
+    outer_br: tuple[int, int]
+
+
+@lru_cache(maxsize=4)
+def _mana_bar_layout(frame_width: int, frame_height: int) -> _BarLayout:
+    """Compute mana bar geometry once per frame size instead of every frame."""
+    bar_width = int(frame_width * 0.4)
+    bar_height = 8
+    x = (frame_width - bar_width) // 2
+    y = frame_height - 30
+    return _BarLayout(
+        x=x,
+        y=y,
+        width=bar_width,
+        height=bar_height,
+        outer_tl=(x - 1, y - 1),
+        outer_br=(x + bar_width + 1, y + bar_height + 1),
+    )
+
+
+@lru_cache(maxsize=256)
+def _text_size(text: str, font: int, scale: float, thickness: int) -> tuple[int, int]:
+    """Measure a HUD label once; mana and spell labels repeat across frames."""
+    return cv2.getTextSize(text, font, scale, thickness)[0]
+
+
+def _landmark_pixels(hand: HandData, width: int, height: int) -> np.ndarray:
+    """Convert a hand's normalized landmarks to an (N, 2) int32 array of pixel coordinates."""
+    landmarks = hand.landmarks
+    coords = np.fromiter(
+        (v for lm in landmarks for v in (lm.x, lm.y)),
+        dtype=np.float64,
+        count=2 * len(landmarks),
+    ).reshape(-1, 2)
+    coords *= (width, height)
+    return coords.astype(np.int32)
+
 
 class SpellRenderer:
     """Renders HUD elements for the spellcaster: mana bar, spell names,
@@ -30,19 +94,11 @@ class SpellRenderer:
             return
 
         h, w = frame.shape[:2]
-        bar_width = int(w * 0.4)
-        bar_height = 8
-        x = (w - bar_width) // 2
-        y = h - 30
+        layout = _mana_bar_layout(w, h)
+        x, y, bar_width, bar_height = layout.x, layout.y, layout.width, layout.height
 
         # Background
-        cv2.rectangle(
-            frame,
-            (x - 1, y - 1),
-            (x + bar_width + 1, y + bar_height + 1),
-            (40, 40, 40),
-            -1,
-        )
+        cv2.rectangle(frame, layout.outer_tl, layout.outer_br, (40, 40, 40), -1)
 
         # Mana fill
         fill_width = int(bar_width * mana.ratio)
@@ -55,17 +111,11 @@ class SpellRenderer:
 
         # Border glow
         border_color = (180, 80, 0) if mana.ratio > 0.2 else (0, 0, 200)
-        cv2.rectangle(
-            frame,
-            (x - 1, y - 1),
-            (x + bar_width + 1, y + bar_height + 1),
-            border_color,
-            1,
-        )
+        cv2.rectangle(frame, layout.outer_tl, layout.outer_br, border_color, 1)
 
         # Mana text
         text = f"MANA {int(mana.current_mana)}/{mana.max_mana}"
-        text_size = cv2.getTextSize(text, self.font, 0.4, 1)[0]
+        text_size = _text_size(text, self.font, 0.4, 1)
         tx = x + (bar_width - text_size[0]) // 2
         ty = y - 5
         cv2.putText(frame, text, (tx, ty), self.font, 0.4, (200, 200, 200), 1, cv2.LINE_AA)
@@ -77,7 +127,7 @@ class SpellRenderer:
 
         h, w = frame.shape[:2]
         display_name = name.upper().replace("_", " ")
-        text_size = cv2.getTextSize(display_name, self.font, 0.8, 2)[0]
+        text_size = _text_size(display_name, self.font, 0.8, 2)
         tx = (w - text_size[0]) // 2
         ty = 40
 
@@ -92,32 +142,27 @@ class SpellRenderer:
             self.font, 0.8, (0, 200, 255), 2, cv2.LINE_AA,
         )
 
-    def draw_landmarks(self, frame: np.ndarray, hands: list) -> None:
+    def draw_landmarks(self, frame: np.ndarray, hands: list[HandData]) -> None:
         """Draw subtle hand landmark connections."""
         color = (0, 128, 100)
         height, width = frame.shape[:2]
 
         for hand in hands:
-            points = [
-                (int(lm.x * width), int(lm.y * height))
-                for lm in hand.landmarks
-            ]
-
-            connections = [
-                (0, 1), (1, 2), (2, 3), (3, 4),
-                (0, 5), (5, 6), (6, 7), (7, 8),
-                (0, 9), (9, 10), (10, 11), (11, 12),
-                (0, 13), (13, 14), (14, 15), (15, 16),
-                (0, 17), (17, 18), (18, 19), (19, 20),
-                (5, 9), (9, 13), (13, 17),
-            ]
-
-            for start, end in connections:
-                if start < len(points) and end < len(points):
-                    cv2.line(
-                        frame, points[start], points[end],
-                        color, 1, cv2.LINE_AA,
-                    )
-
-            for pt in points:
-                cv2.circle(frame, pt, 2, color, -1)
+            num_landmarks = len(hand.landmarks)
+            if not num_landmarks:
+                continue
+
+            points = _landmark_pixels(hand, width, height)
+            edges = HAND_CONNECTIONS
+            if num_landmarks < _MIN_LANDMARKS:
+                # Partial hand: draw only the edges whose endpoints were detected
+                edges = edges[(edges < num_landmarks).all(axis=1)]
+
+            # One polylines call draws every edge as a 2-point segment. These 1 px
+            # lines are redrawn every frame, so skip the anti-aliased rasterizer.
+            if len(edges):
+                cv2.polylines(frame, points[edges], False, color, 1, cv2.LINE_8)
+
+            # Zero-length thick segments rasterize exactly like filled radius-2 circles,
+            # so all joint dots also go through a single call
+            cv2.polylines(frame, np.repeat(points[:, None], 2, axis=1), False, color, 3)
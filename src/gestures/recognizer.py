@@ -23,6 +23,10 @@ class GestureType(Enum):
     PEACE = auto()
 
 
+# Lowercase gesture names used as spell-registry keys, built once instead of per frame
+GESTURE_NAMES: dict[GestureType, str] = {g: g.name.lower() for g in GestureType}
+
+
 @dataclass
 class GestureResult:
     """Result of gesture classification for a single hand."""
@@ -36,6 +40,35 @@ class GestureResult:
         return self.hand_data.handedness
 
 
+# Extended-finger bitmasks (bit i set when Finger(i) is extended)
+_THUMB = 1 << Finger.THUMB
+_INDEX = 1 << Finger.INDEX
+_MIDDLE = 1 << Finger.MIDDLE
+_ALL_FINGERS = (1 << len(Finger)) - 1
+
+# Gestures determined by finger state alone, checked after fist/palm and pinch.
+# THUMBS_UP additionally requires a vertical thumb.
+_MASK_GESTURES: dict[int, tuple[GestureType, float]] = {
+    _THUMB: (GestureType.THUMBS_UP, 0.85),
+    _INDEX: (GestureType.POINT, 0.9),
+    _THUMB | _INDEX: (GestureType.POINT, 0.8),  # natural pointing
+    _INDEX | _MIDDLE: (GestureType.PEACE, 0.85),
+}
+
+_NO_GESTURE = (GestureType.NONE, 0.5)
+
+_PINCH_DISTANCE_SQ = 0.05 * 0.05
+
+
+def _extended_mask(finger_extended: dict[Finger, bool]) -> int:
+    """Encode extended fingers as a 5-bit mask."""
+    mask = 0
+    for finger, extended in finger_extended.items():
+        if extended:
+            mask |= 1 << finger
+    return mask
+
+
 class GestureRecognizer:
     """Rule-based gesture classifier using finger states and landmark geometry.
 
@@ -52,55 +85,32 @@ class GestureRecognizer:
         Returns:
             GestureResult with the detected gesture type.
         """
-        ext = hand.finger_extended
-        num_extended = hand.num_fingers_extended
+        mask = _extended_mask(hand.finger_extended)
 
         # Fist: no fingers extended
-        if num_extended == 0:
+        if mask == 0:
             return GestureResult(gesture=GestureType.FIST, confidence=0.9, hand_data=hand)
 
         # Open palm: all 5 fingers extended
-        if num_extended == 5:
+        if mask == _ALL_FINGERS:
             return GestureResult(gesture=GestureType.OPEN_PALM, confidence=0.9, hand_data=hand)
 
         # Pinch: thumb and index tips close together
         if self._is_pinch(hand):
             return GestureResult(gesture=GestureType.PINCH, confidence=0.85, hand_data=hand)
 
+        gesture, confidence = _MASK_GESTURES.get(mask, _NO_GESTURE)
+
         # Thumbs up: only thumb extended, hand oriented vertically
-        if ext.get(Finger.THUMB, False) and num_extended == 1:
-            if self._is_thumb_up_orientation(hand):
-                return GestureResult(
-                    gesture=GestureType.THUMBS_UP, confidence=0.85, hand_data=hand
-                )
-
-        # Point: only index finger extended
-        if ext.get(Finger.INDEX, False) and num_extended == 1:
-            return GestureResult(gesture=GestureType.POINT, confidence=0.9, hand_data=hand)
-
-        # Point variant: thumb + index extended (natural pointing)
-        if (
-            ext.get(Finger.INDEX, False)
-            and ext.get(Finger.THUMB, False)
-            and num_extended == 2
-        ):
-            return GestureResult(gesture=GestureType.POINT, confidence=0.8, hand_data=hand)
-
-        # Peace sign: index + middle extended
-        if (
-            ext.get(Finger.INDEX, False)
-            and ext.get(Finger.MIDDLE, False)
-            and num_extended == 2
-        ):
-            return GestureResult(gesture=GestureType.PEACE, confidence=0.85, hand_data=hand)
-
-        return GestureResult(gesture=GestureType.NONE, confidence=0.5, hand_data=hand)
+        if gesture is GestureType.THUMBS_UP and not self._is_thumb_up_orientation(hand):
+            gesture, confidence = _NO_GESTURE
+
+        return GestureResult(gesture=gesture, confidence=confidence, hand_data=hand)
 
     def _is_pinch(self, hand: HandData) -> bool:
         """Check if thumb and index fingertips are close together."""
-        distance = hand.thumb_tip.distance_to(hand.index_tip)
-        # Pinch threshold: distance less than ~5% of frame
-        return distance < 0.05
+        # Pinch threshold: distance less than ~5% of frame (compared squared)
+        return hand.thumb_tip.distance_sq_to(hand.index_tip) < _PINCH_DISTANCE_SQ
 
     def _is_thumb_up_orientation(self, hand: HandData) -> bool:
         """Check if the thumb is pointing upward (hand vertical)."""
@@ -42,7 +42,7 @@ class Camera:
         self._source = source if source is not None else config.device_id
         self._cap: cv2.VideoCapture | None = None
         self._frame_count = 0
-        self._fps_target = config.fps
+        self._min_interval = 1.0 / config.fps
         self._last_frame_time = 0.0
 
     @property
@@ -83,10 +83,9 @@ class Camera:
 
         # FPS limiting
         now = time.time()
-        min_interval = 1.0 / self._fps_target
         elapsed = now - self._last_frame_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
+        if elapsed < self._min_interval:
+            time.sleep(self._min_interval - elapsed)
 
         ret, image = self._cap.read()
         if not ret or image is None:
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import logging
 import math
+import threading
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import cached_property
 from pathlib import Path
 
 import numpy as np
@@ -96,6 +98,12 @@ class Point:
         """Euclidean distance to another point."""
         return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
 
+    def distance_sq_to(self, other: Point) -> float:
+        """Squared Euclidean distance; cheaper for threshold comparisons."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
 
 @dataclass
 class HandData:
@@ -122,9 +130,9 @@ class HandData:
     def middle_tip(self) -> Point:
         return self.landmarks[MIDDLE_TIP]
 
-    @property
+    @cached_property
     def center(self) -> Point:
-        """Center of the palm (average of MCP joints)."""
+        """Center of the palm (average of MCP joints), computed once per hand."""
         mcp_indices = [INDEX_MCP, MIDDLE_MCP, RING_MCP, PINKY_MCP]
         avg_x = sum(self.landmarks[i].x for i in mcp_indices) / len(mcp_indices)
         avg_y = sum(self.landmarks[i].y for i in mcp_indices) / len(mcp_indices)
@@ -177,6 +185,28 @@ def _download_model() -> bool:
         return False
 
 
+def _import_mediapipe() -> None:
+    try:
+        import mediapipe  # noqa: F401
+        from mediapipe.tasks.python import vision  # noqa: F401
+    except ImportError:
+        pass  # HandTracker.initialize reports the missing dependency
+
+
+def preload_mediapipe() -> threading.Thread:
+    """Import MediaPipe on a background thread.
+
+    The import takes hundreds of milliseconds; starting it early lets CLI
+    start-up work (argument parsing, banners) overlap with it.
+
+    Returns:
+        The started daemon thread.
+    """
+    thread = threading.Thread(target=_import_mediapipe, name="mediapipe-preload", daemon=True)
+    thread.start()
+    return thread
+
+
 class HandTracker:
     """MediaPipe hand tracking wrapper using the Tasks API.
 
@@ -189,6 +219,9 @@ class HandTracker:
         self._landmarker = None
         self._initialized = False
         self._frame_timestamp_ms = 0
+        self._process_every_n = max(1, config.process_every_n_frames)
+        self._frames_seen = 0
+        self._last_hands: list[HandData] = []
 
     def initialize(self) -> bool:
         """Initialize MediaPipe HandLandmarker."""
@@ -230,6 +263,9 @@ class HandTracker:
     def process(self, frame: np.ndarray) -> list[HandData]:
         """Process a frame and return detected hands.
 
+        Only every ``process_every_n_frames``-th call runs the landmarker;
+        the calls in between return the most recent detection.
+
         Args:
             frame: BGR image from OpenCV.
 
@@ -240,6 +276,13 @@ class HandTracker:
             if not self.initialize():
                 return []
 
+        # Increment timestamp (must be monotonically increasing for VIDEO mode).
+        # Skipped frames still advance it so the tracker sees the real time gap.
+        self._frame_timestamp_ms += 33  # ~30 FPS
+        self._frames_seen += 1
+        if (self._frames_seen - 1) % self._process_every_n:
+            return self._last_hands
+
         import mediapipe as mp
 
         # Convert BGR to RGB
@@ -248,9 +291,7 @@ class HandTracker:
         # Create MediaPipe Image
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
 
-        # Increment timestamp (must be monotonically increasing for VIDEO mode)
-        self._frame_timestamp_ms += 33  # ~30 FPS
-
+        self._last_hands = []
         try:
             results = self._landmarker.detect_for_video(
                 mp_image, self._frame_timestamp_ms
@@ -289,6 +330,7 @@ class HandTracker:
                 )
             )
 
+        self._last_hands = hands
         return hands
 
     def release(self) -> None:
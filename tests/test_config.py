@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import logging.handlers
+import os
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from src.config import (
     AudioConfig,
     CameraConfig,
@@ -11,7 +17,9 @@ from src.config import (
     ParticlesConfig,
     Settings,
     SpellsConfig,
+    _stop_log_listener,
     load_config,
+    setup_logging,
 )
 
 
@@ -35,6 +43,8 @@ class TestHandsConfig:
         assert config.max_hands == 2
         assert config.min_detection_confidence == 0.7
         assert config.min_tracking_confidence == 0.5
+        assert config.process_every_n_frames == 1
+        assert config.async_tracking is False
 
 
 class TestGesturesConfig:
@@ -85,6 +95,28 @@ class TestSettings:
         assert settings.camera.fps == 60
         assert settings.camera.width == 1280
 
+    def test_from_dict_coerces_and_ignores_unknown(self):
+        settings = Settings.from_dict(
+            {
+                "camera": {"fps": 60.0, "unknown": 1},
+                "spells": {"mana_regen": 10},
+                "hands": None,
+            }
+        )
+        assert settings.camera.fps == 60
+        assert isinstance(settings.camera.fps, int)
+        assert settings.spells.mana_regen == 10.0
+        assert isinstance(settings.spells.mana_regen, float)
+        assert settings.hands == HandsConfig()
+
+    def test_from_dict_rejects_bad_types(self):
+        with pytest.raises(TypeError, match="CameraConfig.width"):
+            Settings.from_dict({"camera": {"width": "wide"}})
+
+    def test_from_dict_rejects_non_mapping(self):
+        with pytest.raises(TypeError, match="Settings: expected a mapping, got list"):
+            Settings.from_dict(["camera"])
+
 
 class TestLoadConfig:
     def test_load_default(self):
@@ -96,6 +128,13 @@ class TestLoadConfig:
         settings = load_config("/nonexistent/config.yaml")
         assert isinstance(settings, Settings)
 
+    def test_missing_and_empty_files_share_defaults(self, tmp_path):
+        empty = tmp_path / "empty.yaml"
+        empty.write_text("")
+        defaults = load_config("/nonexistent/config.yaml")
+        assert defaults == Settings()
+        assert load_config(empty) is defaults
+
     def test_load_from_yaml(self, tmp_path):
         yaml_content = """
 camera:
@@ -121,3 +160,60 @@ audio:
         assert settings.spells.mana_regen == 15.0
         assert settings.audio.enabled is False
         assert settings.audio.volume == 0.3
+
+    def test_load_returns_shared_immutable_settings(self, tmp_path):
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("camera:\n  fps: 60\n")
+
+        first = load_config(config_file)
+        with pytest.raises(FrozenInstanceError):
+            first.camera.fps = 15
+        assert load_config(config_file) is first
+
+    def test_reload_after_file_change(self, tmp_path):
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("camera:\n  fps: 60\n")
+        assert load_config(config_file).camera.fps == 60
+
+        config_file.write_text("camera:\n  fps: 24\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config(config_file).camera.fps == 24
+
+    def test_reload_after_same_mtime_rewrite(self, tmp_path):
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("camera:\n  fps: 60\n")
+        mtime_ns = config_file.stat().st_mtime_ns
+        assert load_config(config_file).camera.fps == 60
+
+        config_file.write_text("camera:\n  fps: 120\n")
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+        assert load_config(config_file).camera.fps == 120
+
+    def test_cache_clear(self, tmp_path):
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("camera:\n  fps: 60\n")
+        load_config(config_file)
+        load_config.cache_clear()
+        assert load_config(config_file).camera.fps == 60
+
+
+class TestSetupLogging:
+    def test_reconfigure_and_stop_flush_both_files(self, tmp_path):
+        first = tmp_path / "first.log"
+        second = tmp_path / "second.log"
+        logger = logging.getLogger("tests.setup_logging")
+
+        setup_logging(LoggingConfig(file=str(first)))
+        logger.info("first record")
+        setup_logging(LoggingConfig(file=str(second)))
+        logger.info("second record")
+        _stop_log_listener()
+        _stop_log_listener()  # idempotent
+
+        assert "first record" in first.read_text()
+        assert "second record" in second.read_text()
+        assert "first record" not in second.read_text()
+        assert not any(
+            isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers
+        )
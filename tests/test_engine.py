@@ -0,0 +1,88 @@
+"""Tests for the spell engine's hand tracking dispatch."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, call, patch
+
+import numpy as np
+
+from src.core.engine import SpellEngine
+
+
+class StubHandTracker:
+    """Records submitted frames and blocks each call until released."""
+
+    def __init__(self) -> None:
+        self.frames: list[np.ndarray] = []
+        self.gate = threading.Event()
+
+    def process(self, frame: np.ndarray) -> list[str]:
+        self.frames.append(frame)
+        self.gate.wait(timeout=5)
+        return [f"hands-{len(self.frames)}"]
+
+
+def _make_async_engine(hand_tracker: StubHandTracker) -> SpellEngine:
+    engine = SpellEngine.__new__(SpellEngine)
+    engine.hand_tracker = hand_tracker
+    engine._tracking_pool = ThreadPoolExecutor(max_workers=1)
+    engine._tracking_future = None
+    engine._last_hands = []
+    return engine
+
+
+class TestAsyncTracking:
+    def test_first_call_submits_copy(self):
+        tracker = StubHandTracker()
+        engine = _make_async_engine(tracker)
+        frame = np.full((4, 4, 3), 7, dtype=np.uint8)
+
+        assert engine._track_hands(frame) == []
+        tracker.gate.set()
+        engine._tracking_future.result(timeout=5)
+        engine._tracking_pool.shutdown()
+
+        assert len(tracker.frames) == 1
+        assert tracker.frames[0] is not frame
+        np.testing.assert_array_equal(tracker.frames[0], frame)
+
+    def test_results_lag_one_submission(self):
+        tracker = StubHandTracker()
+        engine = _make_async_engine(tracker)
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        assert engine._track_hands(frame) == []
+        first = engine._tracking_future
+
+        # Worker still busy: keep returning the old result, submit nothing new
+        assert engine._track_hands(frame) == []
+        assert engine._tracking_future is first
+
+        tracker.gate.set()
+        first.result(timeout=5)
+        assert engine._track_hands(frame) == ["hands-1"]
+        second = engine._tracking_future
+        assert second is not first
+
+        second.result(timeout=5)
+        assert engine._track_hands(frame) == ["hands-2"]
+        engine._tracking_pool.shutdown()
+        assert len(tracker.frames) == 3
+
+    @patch("src.core.engine.cv2.destroyAllWindows")
+    def test_cleanup_shuts_pool_before_release(self, _destroy):
+        engine = SpellEngine.__new__(SpellEngine)
+        parent = MagicMock()
+        engine.camera = MagicMock()
+        engine.audio = MagicMock()
+        engine._tracking_pool = parent.pool
+        engine.hand_tracker = parent.hand_tracker
+
+        engine._cleanup()
+
+        assert parent.mock_calls == [
+            call.pool.shutdown(wait=True),
+            call.hand_tracker.release(),
+        ]
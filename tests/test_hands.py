@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.config import HandsConfig
 from src.vision.hands import (
     Finger,
     HandData,
+    HandTracker,
     Point,
     compute_finger_states,
 )
@@ -31,6 +38,11 @@ class TestPoint:
         p = Point(0.5, 0.5)
         assert p.distance_to(p) == 0.0
 
+    def test_distance_sq(self):
+        p1 = Point(0.0, 0.0)
+        p2 = Point(0.3, 0.4)
+        assert abs(p1.distance_sq_to(p2) - 0.25) < 0.001
+
 
 class TestHandData:
     def test_properties(self, sample_landmarks_open_palm):
@@ -55,6 +67,10 @@ class TestHandData:
         assert 0.0 <= center.x <= 1.0
         assert 0.0 <= center.y <= 1.0
 
+    def test_center_is_cached(self):
+        hand = HandData(landmarks=[Point(0.5, 0.5)] * 21, handedness="Right", confidence=0.9)
+        assert hand.center is hand.center
+
     def test_num_fingers_extended(self, hand_data_open_palm, hand_data_fist):
         assert hand_data_open_palm.num_fingers_extended == 5
         assert hand_data_fist.num_fingers_extended == 0
@@ -82,3 +98,35 @@ class TestFingerStates:
         assert states[Finger.MIDDLE] is False
         assert states[Finger.RING] is False
         assert states[Finger.PINKY] is False
+
+
+class TestHandTracker:
+    def _make_tracker(self, every_n: int) -> HandTracker:
+        tracker = HandTracker(HandsConfig(process_every_n_frames=every_n))
+        landmark = SimpleNamespace(x=0.5, y=0.5)
+        tracker._landmarker = MagicMock()
+        tracker._landmarker.detect_for_video.return_value = SimpleNamespace(
+            hand_landmarks=[[landmark] * 21],
+            handedness=[],
+        )
+        tracker._initialized = True
+        return tracker
+
+    @patch.dict("sys.modules", {"mediapipe": MagicMock()})
+    def test_process_every_frame(self):
+        tracker = self._make_tracker(every_n=1)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        for _ in range(3):
+            assert len(tracker.process(frame)) == 1
+        assert tracker._landmarker.detect_for_video.call_count == 3
+
+    @patch.dict("sys.modules", {"mediapipe": MagicMock()})
+    def test_skipped_frames_reuse_last_detection(self):
+        tracker = self._make_tracker(every_n=3)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        results = [tracker.process(frame) for _ in range(4)]
+        assert tracker._landmarker.detect_for_video.call_count == 2
+        assert results[1] is results[0]
+        assert results[2] is results[0]
+        timestamps = [c.args[1] for c in tracker._landmarker.detect_for_video.call_args_list]
+        assert timestamps == [33, 132]
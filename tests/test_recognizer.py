@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from src.gestures.recognizer import GestureRecognizer, GestureType
-from src.vision.hands import HandData, Point
+from src.gestures.recognizer import GESTURE_NAMES, GestureRecognizer, GestureType
+from src.vision.hands import Finger, HandData, Point
 
 
 class TestGestureRecognizer:
@@ -85,3 +85,27 @@ class TestGestureRecognizer:
         )
         result = self.recognizer.classify(hand)
         assert result.gesture == GestureType.NONE
+
+    def test_peace_sign(self):
+        landmarks = [Point(0.5, 0.7)] * 21
+        landmarks[4] = Point(0.35, 0.7)  # Thumb tip away from index tip
+        landmarks[8] = Point(0.45, 0.3)
+        extended = {
+            Finger.THUMB: False,
+            Finger.INDEX: True,
+            Finger.MIDDLE: True,
+            Finger.RING: False,
+            Finger.PINKY: False,
+        }
+        hand = HandData(
+            landmarks=landmarks, handedness="Right", confidence=0.9, finger_extended=extended
+        )
+        result = self.recognizer.classify(hand)
+        assert result.gesture == GestureType.PEACE
+        assert result.confidence == 0.85
+
+
+class TestGestureNames:
+    def test_names_cover_all_gestures(self):
+        assert set(GESTURE_NAMES) == set(GestureType)
+        assert GESTURE_NAMES[GestureType.OPEN_PALM] == "open_palm"
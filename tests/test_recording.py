@@ -0,0 +1,92 @@
+"""Tests for the threaded recording pipeline."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.core.recording import process_video_threaded
+from src.vision.camera import Frame
+
+
+class FakeCamera:
+    def __init__(self, num_frames: int, fail_at: int | None = None) -> None:
+        self.num_frames = num_frames
+        self.fail_at = fail_at
+        self.reads = 0
+
+    def read(self) -> Frame | None:
+        self.reads += 1
+        if self.reads == self.fail_at:
+            raise OSError("capture lost")
+        if self.reads > self.num_frames:
+            return None
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+        return Frame(image=image, timestamp=0.0, frame_number=self.reads, width=4, height=4)
+
+
+class ListWriter:
+    def __init__(self) -> None:
+        self.frames: list[np.ndarray] = []
+
+    def write(self, frame: np.ndarray) -> None:
+        self.frames.append(frame)
+
+    def release(self) -> None:
+        pass
+
+
+class FailingWriter(ListWriter):
+    def write(self, frame: np.ndarray) -> None:
+        raise RuntimeError("encoder died")
+
+
+class TestProcessVideoThreaded:
+    def test_writes_every_frame(self):
+        writer = ListWriter()
+        written = process_video_threaded(FakeCamera(10), lambda f: f.image, writer, prefetch=2)
+        assert written == 10
+        assert len(writer.frames) == 10
+
+    def test_callback_none_stops(self):
+        writer = ListWriter()
+        camera = FakeCamera(100)
+        written = process_video_threaded(
+            camera,
+            lambda f: None if f.frame_number == 5 else f.image,
+            writer,
+            prefetch=2,
+        )
+        assert written == 4
+        assert len(writer.frames) == 4
+
+    def test_writer_failure_is_raised(self):
+        with pytest.raises(RuntimeError, match="encoder died"):
+            process_video_threaded(FakeCamera(100), lambda f: f.image, FailingWriter(), prefetch=2)
+
+    def test_camera_failure_is_raised(self):
+        writer = ListWriter()
+        with pytest.raises(OSError, match="capture lost"):
+            process_video_threaded(
+                FakeCamera(100, fail_at=4),
+                lambda f: f.image,
+                writer,
+                prefetch=2,
+            )
+        assert len(writer.frames) == 3
+
+    def test_non_contiguous_frames_are_copied(self):
+        writer = ListWriter()
+        process_video_threaded(FakeCamera(3), lambda f: f.image[:, ::2], writer, prefetch=2)
+        assert all(frame.flags.c_contiguous for frame in writer.frames)
+
+    def test_non_uint8_frame_is_rejected(self):
+        writer = ListWriter()
+        with pytest.raises(TypeError, match="uint8"):
+            process_video_threaded(
+                FakeCamera(3),
+                lambda f: f.image.astype(np.float32),
+                writer,
+                prefetch=2,
+            )
+        assert writer.frames == []